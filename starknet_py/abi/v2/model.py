@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, OrderedDict, Union
+from typing import Dict, List, Optional, Union
 
 from starknet_py.cairo.data_types import CairoType, EnumType, EventType, StructType
 
@@ -21,7 +21,7 @@ class Abi:
         """
 
         name: str
-        inputs: OrderedDict[str, CairoType]
+        inputs: Dict[str, CairoType]
         outputs: List[CairoType]
 
     @dataclass
@@ -31,7 +31,7 @@ class Abi:
         """
 
         name: str
-        inputs: OrderedDict[str, CairoType]
+        inputs: Dict[str, CairoType]
 
     @dataclass
     class EventStruct:
@@ -40,7 +40,7 @@ class Abi:
         """
 
         name: str
-        members: OrderedDict[str, CairoType]
+        members: Dict[str, CairoType]
 
     @dataclass
     class EventEnum:
@@ -49,7 +49,7 @@ class Abi:
         """
 
         name: str
-        variants: OrderedDict[str, CairoType]
+        variants: Dict[str, CairoType]
 
     Event = Union[EventStruct, EventEnum]
 
@@ -60,9 +60,7 @@ class Abi:
         """
 
         name: str
-        items: OrderedDict[
-            str, Abi.Function
-        ]  # Only functions can be defined in the interface
+        items: Dict[str, Abi.Function]  # Only functions can be defined in the interface
 
     @dataclass
     class Impl:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import dataclasses
+import hashlib
 import json
-from collections import OrderedDict, defaultdict
-from typing import DefaultDict, Dict, List, Optional, Tuple, TypeVar, Union, cast
+import threading
+from collections import OrderedDict
+from itertools import starmap
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TypeVar, Union, cast
 
 from marshmallow import EXCLUDE
 
@@ -27,9 +30,30 @@ from starknet_py.abi.v2.shape import (
     InterfaceDict,
     TypedParameterDict,
 )
-from starknet_py.cairo.data_types import CairoType, EnumType, EventType, StructType
+from starknet_py.cairo.data_types import (
+    ArrayType,
+    CairoType,
+    EnumType,
+    EventType,
+    NamedTupleType,
+    OptionType,
+    StructType,
+    TupleType,
+)
 from starknet_py.cairo.v2.type_parser import TypeParser
 
+# Schema instances are stateless during load, so a single one can be reused for every parsed ABI
+_CONTRACT_ABI_ENTRY_SCHEMA = ContractAbiEntrySchema()
+
+# Parsed ABIs keyed by the digest of their canonical json representation, in least recently used order
+_PARSED_ABI_CACHE: OrderedDict[bytes, Abi] = OrderedDict()
+_PARSED_ABI_CACHE_MAX_SIZE = 256
+# Guards lookups and updates of _PARSED_ABI_CACHE, which are made of several steps
+_PARSED_ABI_CACHE_LOCK = threading.Lock()
+
+# Fields of the impl entry in the order of Abi.Impl constructor arguments
+_get_impl_fields = itemgetter("name", "interface_name")
+
 
 class AbiParsingError(ValueError):
     """
@@ -43,7 +67,7 @@ class AbiParser:
     """
 
     # Entries from ABI grouped by entry type
-    _grouped: DefaultDict[str, List[Dict]]
+    _grouped: Dict[str, List[Dict]]
     # lazy init property
     _type_parser: Optional[TypeParser] = None
 
@@ -53,12 +77,25 @@ class AbiParser:
 
         :param abi_list: Contract's ABI as a list of dictionaries.
         """
-        abi = [
-            ContractAbiEntrySchema().load(entry, unknown=EXCLUDE) for entry in abi_list
-        ]
-        grouped = defaultdict(list)
+        abi = cast(
+            List[Dict],
+            _CONTRACT_ABI_ENTRY_SCHEMA.load(abi_list, many=True, unknown=EXCLUDE),
+        )
+        # Schema accepts only these entry types, so there is no need for a defaultdict
+        grouped: Dict[str, List[Dict]] = {
+            entry_type: []
+            for entry_type in (
+                STRUCT_ENTRY,
+                ENUM_ENTRY,
+                EVENT_ENTRY,
+                FUNCTION_ENTRY,
+                INTERFACE_ENTRY,
+                IMPL_ENTRY,
+                CONSTRUCTOR_ENTRY,
+                L1_HANDLER_ENTRY,
+            )
+        }
         for entry in abi:
-            assert isinstance(entry, dict)
             grouped[entry["type"]].append(entry)
 
         self._grouped = grouped
@@ -79,10 +116,10 @@ class AbiParser:
         )
 
         events: Dict[str, EventType] = {}
+        type_parser = self.type_parser
         for name, event in events_dict.items():
             events[name] = self._parse_event(event)
-            assert self._type_parser is not None
-            self._type_parser.add_defined_type(events[name])
+            type_parser.add_defined_type(events[name])
 
         functions_dict = cast(
             Dict[str, FunctionDict],
@@ -109,6 +146,23 @@ class AbiParser:
         if len(l1_handlers) > 1:
             raise AbiParsingError("L1 handler in ABI must be defined at most once.")
 
+        functions: Dict[str, Abi.Function] = {}
+        parse_function = self._parse_function
+        for name, entry in functions_dict.items():
+            functions[name] = parse_function(entry)
+
+        interfaces: Dict[str, Abi.Interface] = {}
+        parse_interface = self._parse_interface
+        for name, entry in interfaces_dict.items():
+            interfaces[name] = parse_interface(entry)
+
+        implementations: Dict[str, Abi.Impl] = dict(
+            zip(
+                impls_dict,
+                starmap(Abi.Impl, map(_get_impl_fields, impls_dict.values())),
+            )
+        )
+
         return Abi(
             defined_structures=structures,
             defined_enums=enums,
@@ -122,20 +176,43 @@ class AbiParser:
                 if l1_handlers
                 else None
             ),
-            functions={
-                name: self._parse_function(entry)
-                for name, entry in functions_dict.items()
-            },
+            functions=functions,
             events=events,
-            interfaces={
-                name: self._parse_interface(entry)
-                for name, entry in interfaces_dict.items()
-            },
-            implementations={
-                name: self._parse_impl(entry) for name, entry in impls_dict.items()
-            },
+            interfaces=interfaces,
+            implementations=implementations,
         )
 
+    @staticmethod
+    def parse_cached(abi_list: List[Dict]) -> Abi:
+        """
+        Parse abi like :meth:`parse` does, reusing the result if the same abi was parsed before.
+        Returned dataclass is shared between callers, so it must not be modified.
+
+        :param abi_list: Contract's ABI as a list of dictionaries.
+        :raises: AbiParsingError: on any parsing error.
+        :return: Abi dataclass.
+        """
+        key = hashlib.blake2b(
+            json.dumps(abi_list, sort_keys=True, separators=(",", ":")).encode(),
+            digest_size=16,
+        ).digest()
+
+        with _PARSED_ABI_CACHE_LOCK:
+            abi = _PARSED_ABI_CACHE.get(key)
+            if abi is not None:
+                _PARSED_ABI_CACHE.move_to_end(key)
+                return abi
+
+        # Parsing is done without holding the lock, so other ABIs can be looked up in the meantime
+        abi = AbiParser(abi_list).parse()
+
+        with _PARSED_ABI_CACHE_LOCK:
+            _PARSED_ABI_CACHE[key] = abi
+            _PARSED_ABI_CACHE.move_to_end(key)
+            if len(_PARSED_ABI_CACHE) > _PARSED_ABI_CACHE_MAX_SIZE:
+                _PARSED_ABI_CACHE.popitem(last=False)
+        return abi
+
     @property
     def type_parser(self) -> TypeParser:
         if self._type_parser:
@@ -153,13 +230,14 @@ class AbiParser:
             self._grouped[ENUM_ENTRY], "defined enums"
         )
 
-        # Contains sorted members of the struct
-        struct_members: Dict[str, List[TypedParameterDict]] = {}
         structs: Dict[str, StructType] = {}
-
-        # Contains sorted members of the enum
-        enum_members: Dict[str, List[TypedParameterDict]] = {}
         enums: Dict[str, EnumType] = {}
+        defined: Dict[str, Union[StructType, EnumType]] = {}
+
+        # Contains defined types together with their sorted members and the name used in errors
+        pending_members: List[
+            Tuple[Union[StructType, EnumType], List[TypedParameterDict], str]
+        ] = []
 
         # Example problem (with a simplified json structure):
         # [{name: User, fields: {id: Uint256}}, {name: "Uint256", ...}]
@@ -169,45 +247,61 @@ class AbiParser:
         # At the end we will mutate those structures to contain the right fields. An alternative would be to use
         # topological sorting with an additional "unresolved type", so this flow is much easier.
         for name, struct in structs_dict.items():
-            structs[name] = StructType(name, OrderedDict())
-            struct_members[name] = struct["members"]
+            defined[name] = structs[name] = StructType(name, {})
+            pending_members.append(
+                (structs[name], struct["members"], f"members of structure '{name}'")
+            )
 
         for name, enum in enums_dict.items():
-            enums[name] = EnumType(name, OrderedDict())
-            enum_members[name] = enum["variants"]
+            defined[name] = enums[name] = EnumType(name, {})
+            pending_members.append(
+                (enums[name], enum["variants"], f"members of enum '{name}'")
+            )
 
         # Now parse the types of members and save them.
-        defined_structs_enums: Dict[str, Union[StructType, EnumType]] = dict(structs)
-        defined_structs_enums.update(enums)
-
-        self._type_parser = TypeParser(defined_structs_enums)  # pyright: ignore
-        for name, struct in structs.items():
-            members = self._parse_members(
-                cast(List[TypedParameterDict], struct_members[name]),
-                f"members of structure '{name}'",
-            )
-            struct.types.update(members)
-        for name, enum in enums.items():
-            members = self._parse_members(
-                cast(List[TypedParameterDict], enum_members[name]),
-                f"members of enum '{name}'",
-            )
-            enum.variants.update(members)
+        self._type_parser = TypeParser(defined)  # pyright: ignore
+        for defined_type, params, entity_name in pending_members:
+            members = self._parse_members(params, entity_name)
+            if isinstance(defined_type, StructType):
+                defined_type.types.update(members)
+            else:
+                defined_type.variants.update(members)
 
         # All types have their members assigned now
 
-        self._check_for_cycles(defined_structs_enums)
+        self._check_for_cycles(defined)
 
         return structs, enums
 
     @staticmethod
     def _check_for_cycles(structs: Dict[str, Union[StructType, EnumType]]):
-        # We want to avoid creating our own cycle checker as it would make it more complex. json module has a built-in
-        # checker for cycles.
-        try:
-            _to_json(structs)
-        except ValueError as err:
-            raise AbiParsingError(err) from ValueError
+        # Iterative DFS over structures and enums. Types on the current path are "visiting", types whose members
+        # were fully checked are "visited". Reaching a "visiting" type again means there is a cycle.
+        # Types are compared by id, because the dataclasses are mutable and therefore not hashable.
+        visiting: Set[int] = set()
+        visited: Set[int] = set()
+
+        for root in structs.values():
+            if id(root) in visited:
+                continue
+
+            visiting.add(id(root))
+            stack = [(root, _referenced_structs_and_enums(root))]
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+
+                if child is None:
+                    stack.pop()
+                    visiting.remove(id(node))
+                    visited.add(id(node))
+                elif id(child) in visiting:
+                    raise AbiParsingError(
+                        f"Circular reference detected through '{child.name}'."
+                    )
+                elif id(child) not in visited:
+                    visiting.add(id(child))
+                    stack.append((child, _referenced_structs_and_enums(child)))
 
     def _parse_function(self, function: FunctionDict) -> Abi.Function:
         return Abi.Function(
@@ -241,52 +335,61 @@ class AbiParser:
 
     def _parse_members(
         self, params: List[TypedParam], entity_name: str
-    ) -> OrderedDict[str, CairoType]:
-        # Without cast, it complains that 'Type "TypedParameterDict" cannot be assigned to type "T@_group_by_name"'
-        members = AbiParser._group_by_entry_name(cast(List[Dict], params), entity_name)
-        return OrderedDict(
-            (name, self.type_parser.parse_inline_type(param["type"]))
-            for name, param in members.items()
-        )
+    ) -> Dict[str, CairoType]:
+        # Pyright complains that 'Type "TypedParameterDict" cannot be assigned to type "Dict"'
+        members = AbiParser._group_by_entry_name(params, entity_name)  # pyright: ignore
+        parse_inline_type = self.type_parser.parse_inline_type
+        return {
+            name: parse_inline_type(param["type"]) for name, param in members.items()
+        }
 
     def _parse_interface(self, interface: InterfaceDict) -> Abi.Interface:
         return Abi.Interface(
             name=interface["name"],
-            items=OrderedDict(
-                (entry["name"], self._parse_function(entry))
+            items={
+                entry["name"]: self._parse_function(entry)
                 for entry in interface["items"]
-            ),
-        )
-
-    @staticmethod
-    def _parse_impl(impl: ImplDict) -> Abi.Impl:
-        return Abi.Impl(
-            name=impl["name"],
-            interface_name=impl["interface_name"],
+            },
         )
 
     @staticmethod
-    def _group_by_entry_name(
-        dicts: List[Dict], entity_name: str
-    ) -> OrderedDict[str, Dict]:
-        grouped = OrderedDict()
-        for entry in dicts:
-            name = entry["name"]
-            if name in grouped:
-                raise AbiParsingError(
-                    f"Name '{name}' was used more than once in {entity_name}."
-                )
-            grouped[name] = entry
+    def _group_by_entry_name(dicts: List[Dict], entity_name: str) -> Dict[str, Dict]:
+        names = list(map(itemgetter("name"), dicts))
+        grouped = dict(zip(names, dicts))
+        if len(grouped) != len(names):
+            duplicated_name = next(
+                name for i, name in enumerate(names) if names.index(name) != i
+            )
+            raise AbiParsingError(
+                f"Name '{duplicated_name}' was used more than once in {entity_name}."
+            )
         return grouped
 
 
-def _to_json(value):
-    class DataclassSupportingEncoder(json.JSONEncoder):
-        def default(self, o):
-            # Dataclasses are not supported by json. Additionally, dataclasses.asdict() works recursively and doesn't
-            # check for cycles, so we need to flatten dataclasses (by ONE LEVEL) ourselves.
-            if dataclasses.is_dataclass(o):
-                return tuple(getattr(o, field.name) for field in dataclasses.fields(o))
-            return super().default(o)
-
-    return json.dumps(value, cls=DataclassSupportingEncoder)
+def _referenced_structs_and_enums(
+    cairo_type: Union[StructType, EnumType],
+) -> Iterator[Union[StructType, EnumType]]:
+    members = (
+        cairo_type.types if isinstance(cairo_type, StructType) else cairo_type.variants
+    )
+    for member in members.values():
+        yield from _nearest_structs_and_enums(member)
+
+
+def _nearest_structs_and_enums(
+    cairo_type: CairoType,
+) -> Iterator[Union[StructType, EnumType]]:
+    # Only structures and enums can be referenced by name, so only they can close a cycle.
+    # Other types are unwrapped until a structure or an enum is found.
+    if isinstance(cairo_type, (StructType, EnumType)):
+        yield cairo_type
+    elif isinstance(cairo_type, TupleType):
+        for inner_type in cairo_type.types:
+            yield from _nearest_structs_and_enums(inner_type)
+    elif isinstance(cairo_type, NamedTupleType):
+        for inner_type in cairo_type.types.values():
+            yield from _nearest_structs_and_enums(inner_type)
+    elif isinstance(cairo_type, ArrayType):
+        yield from _nearest_structs_and_enums(cairo_type.inner_type)
+    elif isinstance(cairo_type, OptionType):
+        yield from _nearest_structs_and_enums(cairo_type.type)
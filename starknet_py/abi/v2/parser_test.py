@@ -3,7 +3,7 @@ import json
 import pytest
 
 from starknet_py.abi.v2.model import Abi
-from starknet_py.abi.v2.parser import AbiParser
+from starknet_py.abi.v2.parser import AbiParser, AbiParsingError
 from starknet_py.tests.e2e.fixtures.constants import CONTRACTS_COMPILED_V2_DIR
 from starknet_py.tests.e2e.fixtures.misc import read_contract
 
@@ -35,3 +35,79 @@ def test_abi_parse(contract_name):
     parsed_abi = parser.parse()
 
     assert isinstance(parsed_abi, Abi)
+
+
+def _struct(name, *member_types):
+    return {
+        "type": "struct",
+        "name": name,
+        "members": [
+            {"name": f"value{i}", "type": member_type}
+            for i, member_type in enumerate(member_types)
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "abi",
+    [
+        [_struct("Infinite", "Infinite")],
+        [
+            _struct("First", "Second"),
+            _struct("Second", "Third"),
+            _struct("Third", "First"),
+        ],
+        [_struct("Nested", "core::array::Array::<(core::felt252, Nested)>")],
+        [
+            _struct("Node", "core::option::Option::<Tree>"),
+            {
+                "type": "enum",
+                "name": "Tree",
+                "variants": [{"name": "Leaf", "type": "Node"}],
+            },
+        ],
+    ],
+)
+def test_cycle(abi):
+    with pytest.raises(AbiParsingError, match="Circular reference detected"):
+        AbiParser(abi).parse()
+
+
+def test_shared_structure_is_not_a_cycle():
+    abi = [
+        _struct("Shared", "core::felt252"),
+        _struct("First", "Shared", "Shared"),
+        _struct("Second", "First", "core::array::Array::<Shared>"),
+    ]
+
+    parsed_abi = AbiParser(abi).parse()
+
+    assert parsed_abi.defined_structures["Second"].types["value0"] == (
+        parsed_abi.defined_structures["First"]
+    )
+
+
+def test_parse_cached():
+    abi = json.loads(
+        read_contract("erc20_compiled.json", directory=CONTRACTS_COMPILED_V2_DIR)
+    )["abi"]
+
+    parsed_abi = AbiParser.parse_cached(abi)
+
+    assert parsed_abi == AbiParser(abi).parse()
+    assert AbiParser.parse_cached(json.loads(json.dumps(abi))) is parsed_abi
+
+
+def test_duplicated_name():
+    with pytest.raises(
+        AbiParsingError,
+        match="Name 'Second' was used more than once in defined structures",
+    ):
+        AbiParser(
+            [
+                _struct("First", "core::felt252"),
+                _struct("Second", "core::felt252"),
+                _struct("Third", "core::felt252"),
+                _struct("Second", "First"),
+            ]
+        ).parse()
@@ -80,8 +80,8 @@ class EventAbiEntrySchema(OneOfSchema):
     type_field = "kind"
     type_field_remove = False
     type_schemas = {
-        STRUCT_ENTRY: EventStructAbiEntrySchema,
-        ENUM_ENTRY: EventEnumAbiEntrySchema,
+        STRUCT_ENTRY: EventStructAbiEntrySchema(),
+        ENUM_ENTRY: EventEnumAbiEntrySchema(),
     }
 
 
@@ -120,13 +120,14 @@ class InterfaceAbiEntrySchema(Schema):
 
 class ContractAbiEntrySchema(OneOfSchema):
     type_field_remove = False
+    # Schema instances (not classes) are registered, so OneOfSchema doesn't construct a new schema for every entry
     type_schemas = {
-        FUNCTION_ENTRY: FunctionAbiEntrySchema,
-        EVENT_ENTRY: EventAbiEntrySchema,
-        STRUCT_ENTRY: StructAbiEntrySchema,
-        ENUM_ENTRY: EnumAbiEntrySchema,
-        CONSTRUCTOR_ENTRY: ConstructorAbiEntrySchema,
-        L1_HANDLER_ENTRY: L1HandlerAbiEntrySchema,
-        IMPL_ENTRY: ImplAbiEntrySchema,
-        INTERFACE_ENTRY: InterfaceAbiEntrySchema,
+        FUNCTION_ENTRY: FunctionAbiEntrySchema(),
+        EVENT_ENTRY: EventAbiEntrySchema(),
+        STRUCT_ENTRY: StructAbiEntrySchema(),
+        ENUM_ENTRY: EnumAbiEntrySchema(),
+        CONSTRUCTOR_ENTRY: ConstructorAbiEntrySchema(),
+        L1_HANDLER_ENTRY: L1HandlerAbiEntrySchema(),
+        IMPL_ENTRY: ImplAbiEntrySchema(),
+        INTERFACE_ENTRY: InterfaceAbiEntrySchema(),
     }
@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 
 class CairoType(ABC):
@@ -60,8 +60,8 @@ class StructType(CairoType):
     """
 
     name: str  #: Structure name
-    # We need ordered dict, because it is important in serialization
-    types: OrderedDict[str, CairoType]  #: types of every structure member.
+    # Order of members is important in serialization, dicts keep the insertion order
+    types: Dict[str, CairoType]  #: types of every structure member.
 
 
 @dataclass
@@ -71,7 +71,7 @@ class EnumType(CairoType):
     """
 
     name: str
-    variants: OrderedDict[str, CairoType]
+    variants: Dict[str, CairoType]
 
 
 @dataclass
@@ -120,4 +120,4 @@ class EventType(CairoType):
     """
 
     name: str
-    types: OrderedDict[str, CairoType]
+    types: Dict[str, CairoType]
@@ -33,6 +33,8 @@ class TypeParser:
     """
 
     defined_types: Dict[str, Union[StructType, EnumType, EventType]]
+    # Results of parse_inline_type keyed by the type string
+    _inline_cache: Dict[str, CairoType]
 
     def __init__(
         self, defined_types: Dict[str, Union[StructType, EnumType, EventType]]
@@ -43,6 +45,7 @@ class TypeParser:
         :param defined_types: dictionary containing all defined types. For now, they can only be structures.
         """
         self.defined_types = defined_types
+        self._inline_cache = {}
         for name, defined_type in defined_types.items():
             if name != defined_type.name:
                 raise ValueError(
@@ -53,11 +56,14 @@ class TypeParser:
         self, defined_types: Dict[str, Union[StructType, EnumType, EventType]]
     ) -> None:
         self.defined_types.update(defined_types)
+        # Identifiers nested in generic types are left unresolved when undefined, so new types can change the result
+        self._inline_cache.clear()
 
     def add_defined_type(
         self, defined_type: Union[StructType, EnumType, EventType]
     ) -> None:
         self.defined_types.update({defined_type.name: defined_type})
+        self._inline_cache.clear()
 
     def parse_inline_type(self, type_string: str) -> CairoType:
         """
@@ -67,11 +73,18 @@ class TypeParser:
 
         :param type_string: type to parse.
         """
+        cached = self._inline_cache.get(type_string)
+        if cached is not None:
+            return cached
+
         parsed = parse(type_string, self.defined_types)
         if isinstance(parsed, TypeIdentifier):
             for defined_name in self.defined_types.keys():
                 if parsed.name == defined_name.split("<")[0].strip(":"):
-                    return self.defined_types[defined_name]
-            raise UnknownCairoTypeError(parsed.name)
+                    parsed = self.defined_types[defined_name]
+                    break
+            else:
+                raise UnknownCairoTypeError(parsed.name)
 
+        self._inline_cache[type_string] = parsed
         return parsed
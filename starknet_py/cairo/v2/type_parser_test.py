@@ -103,6 +103,19 @@ def test_missing_type():
     assert err_info.value.type_name == "Uint256"
 
 
+def test_parse_is_cached_until_defined_types_change():
+    type_parser = TypeParser({})
+    unresolved = type_parser.parse_inline_type("core::array::Array::<Uint256>")
+
+    assert type_parser.parse_inline_type("core::array::Array::<Uint256>") is unresolved
+
+    type_parser.add_defined_type(uint256_type)
+
+    assert type_parser.parse_inline_type("core::array::Array::<Uint256>") == ArrayType(
+        uint256_type
+    )
+
+
 def test_names_not_matching():
     with pytest.raises(
         ValueError, match="Keys must match name of type, 'OtherName' != 'Uint256'."
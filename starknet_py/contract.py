@@ -76,7 +76,7 @@ class ContractData:
         """
         if self.cairo_version == 1:
             if _is_abi_v2(self.abi):
-                return AbiV2Parser(self.abi).parse()
+                return AbiV2Parser.parse_cached(self.abi)
             return AbiV1Parser(self.abi).parse()
         return AbiParser(self.abi).parse()
 
@@ -1,4 +1,5 @@
-from typing import Literal, TypedDict, Union
+from types import MappingProxyType
+from typing import Literal, Mapping, TypedDict, Union
 
 from starknet_py.constants import FEE_CONTRACT_ADDRESS
 
@@ -6,6 +7,14 @@ MAINNET = "mainnet"
 TESTNET = "testnet"
 PredefinedNetwork = Literal["mainnet", "testnet"]
 
+_NET_ADDRESSES: Mapping[str, str] = MappingProxyType(
+    {
+        MAINNET: "https://alpha-mainnet.starknet.io",
+        TESTNET: "https://alpha4.starknet.io",
+    }
+)
+_PREDEFINED_NETWORKS = frozenset({MAINNET, TESTNET})
+
 
 class CustomGatewayUrls(TypedDict):
     feeder_gateway_url: str
@@ -16,14 +25,11 @@ Network = Union[PredefinedNetwork, str, CustomGatewayUrls]
 
 
 def net_address_from_net(net: str) -> str:
-    return {
-        MAINNET: "https://alpha-mainnet.starknet.io",
-        TESTNET: "https://alpha4.starknet.io",
-    }.get(net, net)
+    return _NET_ADDRESSES.get(net, net)
 
 
 def default_token_address_for_network(net: Network) -> str:
-    if net not in [TESTNET, MAINNET]:
+    if not isinstance(net, str) or net not in _PREDEFINED_NETWORKS:
         raise ValueError(
             "Argument token_address must be specified when using a custom net address"
         )
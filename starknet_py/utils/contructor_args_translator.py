@@ -41,7 +41,7 @@ def translate_constructor_args(
 
 def _get_constructor_serializer_v1(abi: List) -> Optional[FunctionSerializationAdapter]:
     if _is_abi_v2(abi):
-        parsed = AbiV2Parser(abi).parse()
+        parsed = AbiV2Parser.parse_cached(abi)
         constructor = parsed.constructor
 
         if constructor is None or not constructor.inputs: